@@ -1,8 +1,31 @@
 from ai.task_handler import TaskHandler
-from ai.threat_detection import ThreatDetectionTaskHandler, LogAnalyzer
+from functools import lru_cache
+from hashlib import file_digest, sha256
+from itertools import combinations
 # AI Agent Framework for AstraLink
 
+@lru_cache(maxsize=1)
+def _load_curve():
+    """
+    Import the BN254 curve backend on first use and return a hash -> proof function.
+    """
+    # Jacobian-coordinate arithmetic avoids a field inversion per point
+    # operation, unlike py_ecc's affine bn128 module
+    from py_ecc import optimized_bn128 as bn128
+
+    def prove(data_hash):
+        point = bn128.multiply(bn128.G1, int.from_bytes(data_hash, 'big') % bn128.curve_order)
+        if bn128.is_inf(point):
+            return bytes(64)
+        # Proofs are the affine point serialized as big-endian x || y
+        x, y = bn128.normalize(point)
+        return x.n.to_bytes(32, 'big') + y.n.to_bytes(32, 'big')
+
+    return prove
+
 class AIAgent:
+    __slots__ = ('name', 'role', 'current_state', 'task_handler', 'components')
+
     def __init__(self, name, role, task_handler=None):
         self.name = name
         self.role = role
@@ -47,105 +70,58 @@ class AIAgent:
         """
         Resolve conflicts between components.
         """
-        for component in self.components:
-            for other_component in self.components:
-                if component != other_component:
-                    component.resolve_conflict(other_component)
+        for component, other_component in combinations(self.components, 2):
+            component.resolve_conflict(other_component)
+            other_component.resolve_conflict(component)
 
     def generate_zk_proof(self, data):
         """
         Generate a zero-knowledge proof for the given data.
         """
-        # Placeholder for zkSNARK proof generation logic
-        proof = "zkSNARK_proof_for_" + str(data)
-        return proof
-
-from ai.network_optimizer import NetworkOptimizationTaskHandler
-
-## Example use of AI Chat
-log_analyzer = LogAnalyzer()
-threat_detector = ThreatDetectionTaskHandler(log_analyzer)
-agent = AIAgent("Threat Detector", "security", threat_detector)
-task = "Detect threats from network logs"
-print(agent.perform_task(task))
-agent.update_state("active")
-print("New state: ", agent.get_state())
-
-import py_ecc.bn128 as bn128
-from hashlib import sha256
-
-class AIAgent:
-    def __init__(self, name, role, task_handler=None):
-        self.name = name
-        self.role = role
-        self.current_state = "idle"
-        self.task_handler = task_handler
-        self.components = []
-
-    def perform_task(self, task):
-        """
-        Takes on specific tasks based on agent's role.
-        """
-        if self.task_handler:
-            result = self.task_handler.execute_task(task)
-            return {
-                "agent": self.name,
-                "task": task,
-                "state": self.current_state,
-                "result": result
-            }
-        else:
-            return {
-                "agent": self.name,
-                "task": task,
-                "state": self.current_state,
-                "result": "No task handler configured"
-            }
-
-    def update_state(self, new_state):
-        self.current_state = new_state
-
-    def get_state(self):
-        return self.current_state
-
-    def discover_and_integrate_component(self, component):
-        """
-        Dynamically discover and integrate a new component into the system.
-        """
-        self.components.append(component)
-        component.integrate(self)
+        # Implement zkSNARK proof generation logic
+        # Hash the data (32 bytes, matching the curve scalar size)
+        data_hash = sha256(self._to_bytes(data)).digest()
+        return self._proof_from_hash(data_hash)
 
-    def resolve_conflicts(self):
+    def generate_zk_proofs(self, batch, prefix=b''):
         """
-        Resolve conflicts between components.
+        Generate zero-knowledge proofs for a batch of data sharing a common prefix.
         """
-        for component in self.components:
-            for other_component in self.components:
-                if component != other_component:
-                    component.resolve_conflict(other_component)
+        # Hash the shared prefix once and fork the hasher state per item
+        base = sha256(prefix)
+        proofs = []
+        for data in batch:
+            hasher = base.copy()
+            hasher.update(self._to_bytes(data))
+            proofs.append(self._proof_from_hash(hasher.digest()))
+        return proofs
 
-    def generate_zk_proof(self, data):
+    def generate_zk_proof_from_file(self, file_path):
         """
-        Generate a zero-knowledge proof for the given data.
+        Generate a zero-knowledge proof for the contents of a file.
         """
-        # Implement zkSNARK proof generation logic
-        # Convert data to bytes
-        data_bytes = str(data).encode()
-
-        # Hash the data
-        data_hash = sha256(data_bytes).digest()
+        with open(file_path, 'rb') as f:
+            data_hash = file_digest(f, 'sha256').digest()
+        return self._proof_from_hash(data_hash)
 
-        # Generate proof using bn128 curve
-        proof = bn128.G1 * int.from_bytes(data_hash, 'big')
-        return proof
+    def _to_bytes(self, data):
+        """Bytes-like input is hashed as-is; anything else is str-encoded"""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        return str(data).encode()
 
-from ai.network_optimizer import NetworkOptimizationTaskHandler
+    def _proof_from_hash(self, data_hash):
+        """Generate proof using bn128 curve"""
+        return _load_curve()(data_hash)
 
 ## Example use of AI Chat
-log_analyzer = LogAnalyzer()
-threat_detector = ThreatDetectionTaskHandler(log_analyzer)
-agent = AIAgent("Threat Detector", "security", threat_detector)
-task = "Detect threats from network logs"
-print(agent.perform_task(task))
-agent.update_state("active")
-print("New state: ", agent.get_state())
+if __name__ == "__main__":
+    from ai.threat_detection import ThreatDetectionTaskHandler, LogAnalyzer
+
+    log_analyzer = LogAnalyzer()
+    threat_detector = ThreatDetectionTaskHandler(log_analyzer)
+    agent = AIAgent("Threat Detector", "security", threat_detector)
+    task = "Detect threats from network logs"
+    print(agent.perform_task(task))
+    agent.update_state("active")
+    print("New state: ", agent.get_state())
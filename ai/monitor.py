@@ -1,22 +1,101 @@
 import json
+import time
+from functools import lru_cache
+import numpy as np
 import psutil
-from sklearn.ensemble import IsolationForest
 
-def detect_anomalies(log_file):
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Samples an IsolationForest must be fitted on before it is reused
+WARMUP_SAMPLES = 1000
+# Calls between incremental (warm-start) refits of a reused model
+REFIT_INTERVAL = 100
+REFIT_TREES = 10
+# Forest size beyond which a reused model is rebuilt from scratch instead of grown
+MAX_TREES = 300
+
+# IsolationForest works in float32 internally, so features are built at that precision
+ERROR_CORRECTION_DTYPE = np.dtype([
+    ("fidelity", np.float32),
+    ("error_rate", np.float32),
+    ("correction_success_rate", np.float32),
+])
+
+# Fitted models shared across monitor calls, keyed by feature set
+_MODELS = {}
+_FIT_SAMPLES = {}
+_CALLS_SINCE_FIT = {}
+
+def _new_forest():
+    from sklearn.ensemble import IsolationForest
+
+    return IsolationForest(n_estimators=100, contamination=0.1, warm_start=True)
+
+def _predict_anomalies(key, data):
+    """Label rows of data with a cached IsolationForest, fitting it during warmup."""
+    model = _MODELS.get(key)
+    if model is None or _FIT_SAMPLES[key] < WARMUP_SAMPLES:
+        model = _new_forest()
+        anomalies = model.fit_predict(data)
+        _MODELS[key] = model
+        _FIT_SAMPLES[key] = _FIT_SAMPLES.get(key, 0) + len(data)
+        _CALLS_SINCE_FIT[key] = 0
+        return anomalies
+
+    _CALLS_SINCE_FIT[key] += 1
+    if _CALLS_SINCE_FIT[key] >= REFIT_INTERVAL:
+        if model.n_estimators + REFIT_TREES > MAX_TREES:
+            # Rebuild on recent data so memory and predict time stay bounded
+            model = _new_forest()
+            _MODELS[key] = model
+        else:
+            # Grow the forest with trees fitted on recent data
+            model.n_estimators += REFIT_TREES
+        model.fit(data)
+        _CALLS_SINCE_FIT[key] = 0
+    return model.predict(data)
+
+def _load_logs(log_file):
+    """Load a JSON log file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(log_file, 'rb') as f:
+            return orjson.loads(f.read())
     with open(log_file, 'r') as f:
-        logs = json.load(f)
-    model = IsolationForest(n_estimators=100, contamination=0.1)
-    data = [[log.get("metric", 0)] for log in logs]
-    anomalies = model.fit_predict(data)
+        return json.load(f)
+
+def detect_anomalies(log_file):
+    logs = _load_logs(log_file)
+    data = np.fromiter(
+        (log.get("metric", 0) for log in logs), dtype=np.float64, count=len(logs)
+    ).reshape(-1, 1)
+    anomalies = _predict_anomalies("metric", data)
     return [log for i, log in enumerate(logs) if anomalies[i] == -1]
 
+# Seconds a disk usage reading is reused for
+DISK_USAGE_TTL = 5
+
+# Prime psutil's CPU counter so non-blocking reads return a real delta
+psutil.cpu_percent(interval=None)
+_last_bytes_sent = psutil.net_io_counters().bytes_sent
+
+@lru_cache(maxsize=1)
+def _disk_usage_percent(time_bucket):
+    return psutil.disk_usage('/').percent
+
 def check_node_health():
+    global _last_bytes_sent
+    bytes_sent = psutil.net_io_counters().bytes_sent
     health_status = {
-        "cpu_usage": psutil.cpu_percent(interval=1),
+        "cpu_usage": psutil.cpu_percent(interval=None),
         "memory_usage": psutil.virtual_memory().percent,
-        "disk_usage": psutil.disk_usage('/').percent,
-        "network_latency": psutil.net_io_counters().bytes_sent  # Placeholder for actual network latency check
+        "disk_usage": _disk_usage_percent(int(time.monotonic() // DISK_USAGE_TTL)),
+        "network_latency": bytes_sent - _last_bytes_sent  # Placeholder for actual network latency check
     }
+    _last_bytes_sent = bytes_sent
     return health_status
 
 def monitor_node(log_file):
@@ -28,11 +107,13 @@ def monitor_node(log_file):
     }
 
 def detect_anomalies_in_error_correction(log_file):
-    with open(log_file, 'r') as f:
-        logs = json.load(f)
-    model = IsolationForest(n_estimators=100, contamination=0.1)
-    data = [[log.get("fidelity", 0), log.get("error_rate", 0), log.get("correction_success_rate", 0)] for log in logs]
-    anomalies = model.fit_predict(data)
+    logs = _load_logs(log_file)
+    records = np.fromiter(
+        ((log.get("fidelity", 0), log.get("error_rate", 0), log.get("correction_success_rate", 0)) for log in logs),
+        dtype=ERROR_CORRECTION_DTYPE, count=len(logs)
+    )
+    data = records.view(np.float32).reshape(len(logs), 3)
+    anomalies = _predict_anomalies("error_correction", data)
     return [log for i, log in enumerate(logs) if anomalies[i] == -1]
 
 def discover_and_integrate_monitoring_component(component):
@@ -42,5 +123,6 @@ def discover_and_integrate_monitoring_component(component):
     component.integrate()
 
 # Example usage
-monitoring_result = monitor_node("network_logs.json")
-print("Monitoring Result", monitoring_result)
+if __name__ == "__main__":
+    monitoring_result = monitor_node("network_logs.json")
+    print("Monitoring Result", monitoring_result)
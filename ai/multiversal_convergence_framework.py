@@ -1,11 +1,8 @@
 import random
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from ai.ai_agent_framework import AIAgent
 
-logging.basicConfig(level=logging.INFO)
-
-logging.basicConfig(level=logging.INFO)
-
 """
 Multiversal Convergence Framework for AstraLink
 
@@ -19,6 +16,8 @@ class MultiversalConvergence:
     Attributes:
         components (list): List of components to be aligned.
     """
+    __slots__ = ('components',)
+
     def __init__(self, components):
         """
         Initializes the MultiversalConvergence with a list of components.
@@ -36,17 +35,27 @@ class MultiversalConvergence:
             list: List of results indicating the success or failure of alignment.
         """
         try:
-            for comp in self.components:
-                try:
-                    comp.update_state("aligned")
-                except AttributeError as e:
-                    logging.error(f"Component missing update_state method: {str(e)}")
-                    continue
+            # Components may do network/IPC work in update_state, so align them concurrently
+            if self.components:
+                with ThreadPoolExecutor(max_workers=min(32, len(self.components))) as executor:
+                    list(executor.map(self._align_component, self.components))
             return ["Systems aligned successfully."]
         except Exception as e:
             logging.critical(f"Critical alignment failure: {str(e)}", exc_info=True)
             return [f"Critical alignment failure: {str(e)}"]
 
+    def _align_component(self, comp):
+        """
+        Aligns a single component, logging components that cannot be aligned.
+
+        Args:
+            comp (any): The component to align.
+        """
+        try:
+            comp.update_state("aligned")
+        except AttributeError as e:
+            logging.error(f"Component missing update_state method: {str(e)}")
+
     def validate_harmony(self, timelines):
         """
         Validates the harmony of the system using provided timelines.
@@ -93,7 +102,9 @@ class MultiversalConvergence:
         component.integrate(self)
 
 # Test instance
-systems = [AIAgent("Chat AstraLink", "System sync")]
-muf = MultiversalConvergence(systems)
-aligned = muf.align_systems()
-print(aligned)
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    systems = [AIAgent("Chat AstraLink", "System sync")]
+    muf = MultiversalConvergence(systems)
+    aligned = muf.align_systems()
+    print(aligned)
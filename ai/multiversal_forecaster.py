@@ -1,77 +1,104 @@
 import asyncio
+import itertools
 from typing import Dict, Any
 import time
+from functools import lru_cache
 import numpy as np
-from sklearn.linear_model import LinearRegression
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Low bits of prediction IDs, so IDs minted in the same millisecond differ
+_prediction_sequence = itertools.count()
+
+# Seconds per timeframe unit suffix
+TIMEFRAME_UNITS = {'h': 3600, 'm': 60, 's': 1}
 
 class MultiversalForecaster:
     """AI-driven network load forecasting system"""
     
     def __init__(self):
+        from sklearn.linear_model import LinearRegression
+
         self.model_initialized = False
         self.forecasting_components = []
         self.model = LinearRegression()
-        print("[MultiversalForecaster] Initializing AI forecasting system")
+        logger.debug("Initializing AI forecasting system")
         
     async def predict_network_load(self, 
                                  current_allocation: Dict[str, Any],
                                  timeframe: str = "1h",
                                  confidence_level: float = 0.95) -> Dict[str, Any]:
         """Predict future network load using ML models"""
+        model_inference = None
         try:
-            print(f"[MultiversalForecaster] Predicting network load for next {timeframe}...")
+            logger.debug(f"Predicting network load for next {timeframe}...")
             
-            # Simulate ML prediction time
-            await asyncio.sleep(0.5)
+            # Simulate ML prediction time; it runs concurrently with the
+            # component forecasts below instead of in front of them
+            model_inference = asyncio.create_task(asyncio.sleep(0.5))
             
             # Convert timeframe to seconds
             duration = self._parse_timeframe(timeframe)
-            current_time = int(time.time())
+            now_ns = time.time_ns()
+            current_time = now_ns // 1_000_000_000
+            
+            # 5-minute intervals over the requested timeframe
+            steps = np.arange(duration // 300, dtype=np.int64)
+            timestamps = (current_time + steps * 300).tolist()
+            bandwidth_usage = current_allocation.get("bandwidth", 1000) * (1 + steps * 0.1)
+            latency_trend = 5 + steps * 0.5
             
             # Generate mock prediction data
             prediction = {
-                "prediction_id": f"pred_{current_time}",
+                "prediction_id": self._next_prediction_id(now_ns),
                 "timestamp": current_time,
                 "timeframe": timeframe,
                 "confidence_level": confidence_level,
                 "predictions": {
-                    "bandwidth_usage": {
-                        current_time + i * 300: current_allocation.get("bandwidth", 1000) * (1 + i * 0.1)
-                        for i in range(int(duration / 300))  # 5-minute intervals
-                    },
-                    "latency_trend": {
-                        current_time + i * 300: 5 + i * 0.5
-                        for i in range(int(duration / 300))
-                    }
+                    "bandwidth_usage": dict(zip(timestamps, bandwidth_usage.tolist())),
+                    "latency_trend": dict(zip(timestamps, latency_trend.tolist()))
                 },
                 "reliability_score": 0.95
             }
             
-            # Integrate dynamic forecasting components
-            for component in self.forecasting_components:
-                component_prediction = await component.predict(current_allocation, timeframe, confidence_level)
+            # Integrate dynamic forecasting components, querying them concurrently
+            component_predictions = await asyncio.gather(
+                *(component.predict(current_allocation, timeframe, confidence_level)
+                  for component in self.forecasting_components),
+                return_exceptions=True
+            )
+            for component, component_prediction in zip(self.forecasting_components, component_predictions):
+                if isinstance(component_prediction, Exception):
+                    logger.error(f"Forecasting component {type(component).__name__} failed: {str(component_prediction)}")
+                    continue
                 prediction["predictions"].update(component_prediction["predictions"])
             
-            print("[MultiversalForecaster] Load prediction completed successfully")
+            await model_inference
+            
+            logger.debug("Load prediction completed successfully")
             return prediction
             
         except Exception as e:
-            print(f"[MultiversalForecaster] ERROR: Failed to predict network load: {str(e)}")
+            if model_inference is not None:
+                model_inference.cancel()
+            logger.error(f"Failed to predict network load: {str(e)}")
             raise
             
-    def _parse_timeframe(self, timeframe: str) -> int:
+    @staticmethod
+    def _next_prediction_id(now_ns: int) -> int:
+        """Build a unique 64-bit prediction ID from a millisecond timestamp and a sequence"""
+        return ((now_ns // 1_000_000) << 20) | (next(_prediction_sequence) & 0xFFFFF)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_timeframe(timeframe: str) -> int:
         """Convert timeframe string to seconds"""
-        unit = timeframe[-1]
-        value = int(timeframe[:-1])
-        
-        if unit == 'h':
-            return value * 3600
-        elif unit == 'm':
-            return value * 60
-        elif unit == 's':
-            return value
-        else:
+        unit_seconds = TIMEFRAME_UNITS.get(timeframe[-1])
+        if unit_seconds is None:
             raise ValueError(f"Invalid timeframe format: {timeframe}")
+        
+        return int(timeframe[:-1]) * unit_seconds
 
     def discover_and_integrate_forecasting_component(self, component):
         """
@@ -83,10 +110,13 @@ class MultiversalForecaster:
     def train_model(self, X, y):
         """Train the ML model with historical data"""
         self.model.fit(X, y)
+        # Cache the fitted parameters so predict can skip sklearn's input validation
+        self._coef = np.asarray(self.model.coef_, dtype=np.float64).T
+        self._intercept = self.model.intercept_
         self.model_initialized = True
 
     def predict(self, X):
         """Make predictions using the trained ML model"""
         if not self.model_initialized:
             raise ValueError("Model is not trained yet")
-        return self.model.predict(X)
+        return np.asarray(X, dtype=np.float64) @ self._coef + self._intercept
@@ -6,23 +6,56 @@ Provides AI-powered network optimization and quantum-secure monitoring for eSIM
 """
 
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+import copy
 import asyncio
-from quantum.quantum_interface import QuantumSystem
-from ai.reinforcement_learning_pipeline import ReinforcementLearner
+import time
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
 class NetworkOptimizer:
+    # Optimization results are reused for near-identical metrics
+    CACHE_MAX_SIZE = 1000
+    CACHE_TTL = 300  # seconds
+    # QoS metrics that make up cache keys, with the decimal places each is rounded to
+    CACHE_KEY_PRECISION = {
+        'bandwidth': 1,
+        'latency': 1,
+        'packet_loss': 2,
+        'signal_strength': 0
+    }
+
+    # Performance scores kept per token for historical averages
+    HISTORY_CAPACITY = 1000
+
     def __init__(self):
-        self.quantum_system = QuantumSystem()
-        self.rl_pipeline = ReinforcementLearner()
+        self._quantum_system = None
+        self._rl_pipeline = None
         self.historical_data = {}
-        self.optimization_cache = {}
+        self.optimization_cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
         self.active_optimizations = set()
         self.optimization_components = []
 
+    @property
+    def quantum_system(self):
+        """Quantum backend, imported and created on first use"""
+        if self._quantum_system is None:
+            from quantum.quantum_interface import QuantumSystem
+            self._quantum_system = QuantumSystem()
+        return self._quantum_system
+
+    @property
+    def rl_pipeline(self):
+        """Reinforcement learning pipeline, imported and created on first use"""
+        if self._rl_pipeline is None:
+            from ai.reinforcement_learning_pipeline import ReinforcementLearner
+            self._rl_pipeline = ReinforcementLearner()
+        return self._rl_pipeline
+
     async def optimize_network_allocation(
         self,
         token_id: int,
@@ -31,11 +64,18 @@ class NetworkOptimizer:
     ) -> Dict[str, Any]:
         """Optimize network resource allocation using quantum-enhanced AI"""
         try:
+            # Reuse a fresh result for near-identical metrics
+            cache_key = self._get_cache_key(token_id, current_metrics, target_qos)
+            cached = self._get_cached_optimization(cache_key)
+            if cached is not None:
+                return cached
+            
             # Get historical performance data
             history = await self._get_performance_history(token_id)
             
             # Create optimization state
             state = self._create_optimization_state(
+                token_id,
                 current_metrics,
                 history,
                 target_qos
@@ -60,13 +100,13 @@ class NetworkOptimizer:
                 current_metrics
             )
             
-            # Cache optimization results
-            self._cache_optimization_result(token_id, validated_allocation)
-            
             # Integrate dynamic optimization components
             for component in self.optimization_components:
                 component.optimize(validated_allocation, current_metrics)
             
+            # Cache the fully optimized result, so hits match misses
+            self._cache_optimization_result(cache_key, validated_allocation)
+            
             return validated_allocation
 
         except Exception as e:
@@ -153,13 +193,14 @@ class NetworkOptimizer:
 
     def _create_optimization_state(
         self,
+        token_id: int,
         current_metrics: Dict[str, Any],
         history: List[Dict[str, Any]],
         target_qos: int
     ) -> Dict[str, Any]:
         """Create state representation for optimization"""
         # Calculate historical performance metrics
-        avg_performance = np.mean([h['performance_score'] for h in history]) if history else 0
+        avg_performance = self._get_average_performance(token_id)
         reliability_trend = self._calculate_reliability_trend(history)
         congestion_pattern = self._analyze_congestion_pattern(history)
         
@@ -172,6 +213,36 @@ class NetworkOptimizer:
             'network_state': self._get_network_state()
         }
 
+    def _update_history(
+        self,
+        token_id: int,
+        current_metrics: Dict[str, Any],
+        allocation: Dict[str, Any]
+    ) -> None:
+        """Record a performance score in the token's fixed-size history"""
+        history = self.historical_data.get(token_id)
+        if history is None:
+            history = {
+                'scores': np.zeros(self.HISTORY_CAPACITY, dtype=np.float64),
+                'count': 0,
+                'score_sum': 0.0
+            }
+            self.historical_data[token_id] = history
+        
+        # Overwrite the oldest score, keeping the running sum in step
+        index = history['count'] % self.HISTORY_CAPACITY
+        score = current_metrics['performance_score']
+        history['score_sum'] += score - history['scores'][index]
+        history['scores'][index] = score
+        history['count'] += 1
+
+    def _get_average_performance(self, token_id: int) -> float:
+        """Get the mean recorded performance score for a token"""
+        history = self.historical_data.get(token_id)
+        if not history or not history['count']:
+            return 0
+        return history['score_sum'] / min(history['count'], self.HISTORY_CAPACITY)
+
     def _get_reward_function(self, target_qos: int):
         """Create reward function for reinforcement learning"""
         def reward_function(state: Dict[str, Any], action: Dict[str, Any]) -> float:
@@ -259,14 +330,40 @@ class NetworkOptimizer:
             logger.error(f"Failed to apply optimization: {str(e)}")
             raise
 
-    def _cache_optimization_result(
+    def _get_cache_key(
         self,
         token_id: int,
+        current_metrics: Dict[str, Any],
+        target_qos: int
+    ) -> Tuple:
+        """Build a cache key from the QoS metrics rounded to a coarse grid"""
+        # Counters and timestamps change on every call, so only QoS metrics are keyed
+        metrics = tuple(
+            None if current_metrics.get(name) is None else round(current_metrics[name], precision)
+            for name, precision in self.CACHE_KEY_PRECISION.items()
+        )
+        return (token_id, target_qos, metrics)
+
+    def _get_cached_optimization(self, cache_key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached allocation if it is still within the TTL"""
+        entry = self.optimization_cache.get(cache_key)
+        if entry is None or time.time() - entry['timestamp'] > self.CACHE_TTL:
+            self._cache_misses += 1
+            return None
+        
+        self.optimization_cache.move_to_end(cache_key)
+        self._cache_hits += 1
+        # Callers get their own copy so mutating it cannot corrupt the cache
+        return copy.deepcopy(entry['allocation'])
+
+    def _cache_optimization_result(
+        self,
+        cache_key: Tuple,
         allocation: Dict[str, Any]
     ) -> None:
         """Cache optimization results for future reference"""
-        self.optimization_cache[token_id] = {
-            'allocation': allocation,
+        self.optimization_cache[cache_key] = {
+            'allocation': copy.deepcopy(allocation),
             'timestamp': int(time.time()),
             'metrics': {
                 'performance_score': allocation['performance_score'],
@@ -274,6 +371,26 @@ class NetworkOptimizer:
                 'quantum_confidence': allocation['quantum_confidence']
             }
         }
+        self.optimization_cache.move_to_end(cache_key)
+        
+        # Evict least recently used results
+        while len(self.optimization_cache) > self.CACHE_MAX_SIZE:
+            self.optimization_cache.popitem(last=False)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get optimization cache statistics"""
+        return {
+            'size': len(self.optimization_cache),
+            'max_size': self.CACHE_MAX_SIZE,
+            'hits': self._cache_hits,
+            'misses': self._cache_misses
+        }
+
+    def clear_cache(self) -> None:
+        """Clear cached optimization results"""
+        self.optimization_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def discover_and_integrate_optimization_component(self, component):
         """
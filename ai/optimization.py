@@ -1,22 +1,82 @@
-from sklearn.model_selection import GridSearchCV, cross_val_score
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold, cross_val_score
 from sklearn.linear_model import LinearRegression
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import logging
 
-source = [performance_data]
+# Shared by every model for running integrated optimization models; workers
+# are only started when one is run
+_OPTIMIZATION_POOL = ThreadPoolExecutor(max_workers=8)
 
-class NetworkOptimizationModel(GridSearchCV):
-    def __init__(self, data, targets):
-        param_grid = {
-            'fit_intercept': [True, False],
-            'normalize': [True, False]
-        }
-        super().__init__(estimator=LinearRegression(), param_grid=param_grid, cv=5)
-        self.data = data
-        self.targets = targets
+class NetworkOptimizationModel(RegressorMixin, BaseEstimator):
+    # Rescaling columns does not change an unregularized least-squares fit,
+    # so the old 'normalize' option had no effect and only the intercept varies
+    param_grid = {
+        'fit_intercept': [True, False]
+    }
+
+    def __init__(self, data, targets, cv=5):
+        self.data = np.ascontiguousarray(data, dtype=np.float64)
+        self.targets = np.ascontiguousarray(targets, dtype=np.float64)
+        self.cv = cv
         self.fit(self.data, self.targets)
         self.optimization_models = []
 
+    def _kfold(self):
+        """Unshuffled folds, the same splits GridSearchCV(cv=self.cv) uses for a regressor"""
+        return KFold(n_splits=self.cv)
+
+    def fit(self, X, y):
+        """Select the intercept option by k-fold CV, like GridSearchCV over LinearRegression"""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        # A trailing ones column lets one design matrix serve both intercept options
+        X_aug = np.hstack([X, np.ones((X.shape[0], 1))])
+        options = self.param_grid['fit_intercept']
+
+        # Folds in the outer loop: each fold is sliced once and shared by every
+        # candidate; lstsq works on the design matrix, not the squared-condition Gram
+        split_scores = np.empty((len(options), self.cv))
+        for split, (train_idx, val_idx) in enumerate(self._kfold().split(X)):
+            X_train, y_train = X_aug[train_idx], y[train_idx]
+            X_val, y_val = X_aug[val_idx], y[val_idx]
+            for i, fit_intercept in enumerate(options):
+                cols = self._columns(fit_intercept)
+                coef = np.linalg.lstsq(X_train[:, cols], y_train, rcond=None)[0]
+                split_scores[i, split] = r2_score(y_val, X_val[:, cols] @ coef)
+
+        mean_scores = split_scores.mean(axis=1)
+        # Ties share the better rank and the first candidate wins, as in GridSearchCV
+        ranks = np.array([1 + np.sum(mean_scores > score) for score in mean_scores], dtype=np.int32)
+        self.cv_results_ = {
+            'params': [{'fit_intercept': option} for option in options],
+            'param_fit_intercept': np.array(options, dtype=object),
+            **{f'split{split}_test_score': split_scores[:, split] for split in range(self.cv)},
+            'mean_test_score': mean_scores,
+            'std_test_score': split_scores.std(axis=1),
+            'rank_test_score': ranks
+        }
+        self.best_index_ = int(np.argmin(ranks))
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = float(mean_scores[self.best_index_])
+
+        self.best_estimator_ = LinearRegression(**self.best_params_).fit(X, y)
+        self.coef_ = self.best_estimator_.coef_
+        self.intercept_ = self.best_estimator_.intercept_
+        return self
+
+    def predict(self, X):
+        """Predict targets with the selected linear model"""
+        return np.asarray(X, dtype=np.float64) @ self.coef_.T + self.intercept_
+
+    @staticmethod
+    def _columns(fit_intercept):
+        """Columns of the augmented design matrix used by an intercept option"""
+        return slice(None) if fit_intercept else slice(None, -1)
+
     def optimize_bandwidth(self, server_data):
         """Optimize network bandwidth allocation using ML"""
         try:
@@ -27,7 +87,7 @@ class NetworkOptimizationModel(GridSearchCV):
             features = self._extract_network_features(normalized_data)
             
             # Predict optimal bandwidth allocation
-            predictions = self.model.predict(features)
+            predictions = self.predict(features)
             
             # Apply quantum correction
             quantum_corrected = self._apply_quantum_correction(predictions)
@@ -35,9 +95,11 @@ class NetworkOptimizationModel(GridSearchCV):
             # Generate optimization plan
             optimization_plan = self._create_bandwidth_plan(quantum_corrected)
             
-            # Integrate dynamic optimization models
-            for model in self.optimization_models:
-                model_optimization = model.optimize(server_data)
+            # Integrate dynamic optimization models, run concurrently and merged in order
+            model_optimizations = _OPTIMIZATION_POOL.map(
+                lambda model: model.optimize(server_data), self.optimization_models
+            )
+            for model_optimization in model_optimizations:
                 optimization_plan.update(model_optimization)
             
             return {
@@ -84,7 +146,11 @@ class NetworkOptimizationModel(GridSearchCV):
 
     def evaluate_model(self):
         """Evaluate model performance using cross-validation"""
-        scores = cross_val_score(self, self.data, self.targets, cv=5)
+        estimator = LinearRegression(**self.best_params_)
+        scores = cross_val_score(
+            estimator, self.data, self.targets,
+            cv=self._kfold(), n_jobs=-1, pre_dispatch='2*n_jobs'
+        )
         return {
             "mean_score": np.mean(scores),
             "std_dev": np.std(scores)
@@ -1,52 +1,238 @@
 # AI module for predictive maintenance
 
-import tensorflow as tf
-from typing import Dict, List
+import asyncio
+import importlib
+import itertools
+import mmap
+import os
+from typing import Dict, List, Optional
 import numpy as np
 from quantum.quantum_error_correction import QuantumErrorCorrection
 import json
-from sklearn.ensemble import IsolationForest
+from scipy.special import expit
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Leave functions uncompiled when numba is not installed"""
+        return lambda func: func
+
+def _tf():
+    """Import TensorFlow on first use so importing this module stays cheap"""
+    return importlib.import_module('tensorflow')
+
+# Order of metrics in the model input vector, with telecom industry ranges
+METRIC_ORDER = ('latency', 'error_rate', 'throughput', 'resource_usage',
+                'signal_strength', 'interference_level')
+_METRIC_MIN = np.array([0, 0, 0, 0, -120, -90], dtype=np.float32)
+_METRIC_MAX = np.array([100, 0.01, 10000, 100, -50, -30], dtype=np.float32)
+_METRIC_IDEAL = np.array([0, 0, 10000, 60, -50, -90], dtype=np.float32)
+# Range spans and normalized ideal points, computed once for every caller
+_METRIC_SPAN = _METRIC_MAX - _METRIC_MIN
+_METRIC_IDEAL_NORM = (_METRIC_IDEAL - _METRIC_MIN) / _METRIC_SPAN
+_METRIC_WEIGHTS = np.array([0.25, 0.25, 0.15, 0.15, 0.10, 0.10], dtype=np.float32)
+_METRIC_IDX = {metric: i for i, metric in enumerate(METRIC_ORDER)}
+# Health-score sigmoid 1 / (1 + exp(-10 (s - 0.5))) tabulated over s in [0, 1]
+_SIGMOID_LUT_SIZE = 4096
+_SIGMOID_LUT = expit(10.0 * (np.linspace(0.0, 1.0, _SIGMOID_LUT_SIZE) - 0.5))
+
+@njit(cache=True, fastmath=True)
+def _norm(i, value):
+    """Normalize one metric by its distance from the ideal value"""
+    return 1.0 - abs((value - _METRIC_MIN[i]) / _METRIC_SPAN[i] - _METRIC_IDEAL_NORM[i])
+
+@njit(cache=True)
+def _gate(x, mean, std, k):
+    """Clip metrics to within k standard deviations of their mean"""
+    out = np.empty_like(x)
+    for i in range(x.size):
+        bound = k * std[i]
+        out[i] = min(max(x[i], mean[i] - bound), mean[i] + bound)
+    return out
+
+# Preprocessed samples observed before the outlier gate is applied
+OUTLIER_CALIBRATION_SAMPLES = 256
+# Standard deviations from the running mean beyond which a metric is an outlier
+OUTLIER_Z_THRESHOLD = 3.0
+# Relative floor on the running std, so near-constant metrics are not all outliers
+OUTLIER_STD_FLOOR = 1e-6
+# Maintenance recommendations for failure probabilities in
+# [0, 0.5], (0.5, 0.8] and (0.8, 1]
+RECOMMENDATIONS = (
+    "Monitor and log normal operation",
+    "Schedule preventive maintenance",
+    "Immediate action required"
+)
+_RECOMMENDATION_THRESHOLDS = np.array([0.5, 0.8])
+# Data files at least this large are parsed from a memory map
+MMAP_THRESHOLD = 64 * 1024 * 1024
+# Normal-operation records kept in the maintenance history ring buffer
+HISTORY_CAPACITY = 10000
 
 class PredictiveMaintenance:
-    def __init__(self):
+    def __init__(self, calibration_data: Optional[np.ndarray] = None):
         self.model = self._build_predictive_model()
         self.qec = QuantumErrorCorrection()
-        self.maintenance_history = []
+        # Columnar ring buffer of normal-operation records; metrics are the raw
+        # readings in METRIC_ORDER, NaN where a log did not report one
+        self._hist_metrics = np.empty((HISTORY_CAPACITY, len(METRIC_ORDER)), dtype=np.float64)
+        self._hist_components = np.empty(HISTORY_CAPACITY, dtype=object)
+        self._hist_ts = np.empty(HISTORY_CAPACITY, dtype='datetime64[ns]')
+        self._hist_idx = 0
         self.anomaly_detector = self._build_anomaly_detector()
-        self.outlier_detector = IsolationForest(n_estimators=100, contamination=0.1)
+
+        # Traced once for any batch size, so inference skips predict() overhead;
+        # no XLA, which would recompile for every new batch size
+        tf = _tf()
+        n_metrics = len(METRIC_ORDER)
+        self._predict_fn = tf.function(
+            lambda x: self.model(x, training=False),
+            input_signature=[tf.TensorSpec((None, 1, n_metrics), tf.float32)]
+        )
+        self._anomaly_fn = tf.function(
+            lambda x: self.anomaly_detector(x, training=False),
+            input_signature=[tf.TensorSpec((None, n_metrics), tf.float32)]
+        )
+        # int8 TFLite interpreters, available once quantize_models() has run
+        self._failure_interpreter = None
+        self._anomaly_interpreter = None
+
+        # Per-metric running statistics (Welford) for the outlier gate
+        self._outlier_count = 0
+        self._outlier_mean = np.zeros(len(METRIC_ORDER))
+        self._outlier_m2 = np.zeros(len(METRIC_ORDER))
         self.maintenance_components = []
 
+        if calibration_data is not None:
+            self._calibrate_outlier_stats(calibration_data)
+
     def _build_predictive_model(self):
+        # Convolutions run in parallel over the time axis, unlike stacked LSTMs
+        tf = _tf()
         return tf.keras.Sequential([
-            tf.keras.layers.LSTM(64, return_sequences=True),
-            tf.keras.layers.LSTM(32),
+            tf.keras.layers.Conv1D(32, kernel_size=3, padding='same', activation='relu'),
+            tf.keras.layers.GlobalAveragePooling1D(),
             tf.keras.layers.Dense(16, activation='relu'),
             tf.keras.layers.Dense(1, activation='sigmoid')
         ])
 
     def _build_anomaly_detector(self):
+        tf = _tf()
         return tf.keras.Sequential([
             tf.keras.layers.Dense(64, activation='relu'),
             tf.keras.layers.Dense(32, activation='relu'),
             tf.keras.layers.Dense(1, activation='sigmoid')
         ])
 
-    async def predict_failures(self, network_metrics: Dict) -> List[Dict]:
+    def quantize_models(self, calibration_data: np.ndarray) -> None:
+        """Post-training int8 quantization of both models for edge inference"""
+        calibration_data = np.asarray(calibration_data, dtype=np.float32).reshape(-1, len(METRIC_ORDER))
+        sequences = calibration_data[:, np.newaxis, :]
+
+        # Make sure both models have built their weights before conversion
+        self.model(sequences[:1], training=False)
+        self.anomaly_detector(calibration_data[:1], training=False)
+
+        self._failure_interpreter = self._build_int8_interpreter(self.model, sequences)
+        self._anomaly_interpreter = self._build_int8_interpreter(self.anomaly_detector, calibration_data)
+
+    @staticmethod
+    def _build_int8_interpreter(model, calibration_data: np.ndarray):
+        """Convert a Keras model to an int8 TFLite interpreter"""
+        def representative_dataset():
+            for sample in calibration_data:
+                yield [sample[np.newaxis, ...]]
+
+        tf = _tf()
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+
+        interpreter = tf.lite.Interpreter(model_content=converter.convert())
+        interpreter.allocate_tensors()
+        return interpreter
+
+    @staticmethod
+    def _run_interpreter(interpreter, x: np.ndarray) -> np.ndarray:
+        """Run a TFLite interpreter on a float32 batch"""
+        input_details = interpreter.get_input_details()[0]
+        if tuple(input_details['shape']) != x.shape:
+            interpreter.resize_tensor_input(input_details['index'], x.shape)
+            interpreter.allocate_tensors()
+        interpreter.set_tensor(input_details['index'], x)
+        interpreter.invoke()
+        return interpreter.get_tensor(interpreter.get_output_details()[0]['index'])
+
+    async def predict_failures(self, network_metrics_list: List[Dict]) -> List[Dict]:
         """Predict potential network failures before they occur"""
-        preprocessed_metrics = self._preprocess_metrics(network_metrics)
-        predictions = self.model.predict(preprocessed_metrics)
+        if not network_metrics_list:
+            return []
+
+        probabilities = self._failure_probabilities(
+            self._preprocess_metrics_batch(network_metrics_list)
+        )
+
+        predictions = [{
+            "component": metrics.get("component"),
+            "probability": float(probability),
+            "time": metrics.get("estimated_time")
+        } for metrics, probability in zip(network_metrics_list, probabilities)]
         
         # Integrate dynamic maintenance components
-        for component in self.maintenance_components:
-            component_prediction = await component.predict(network_metrics)
-            predictions.extend(component_prediction)
-        
+        component_predictions = await asyncio.gather(*(
+            component.predict(network_metrics)
+            for component in self.maintenance_components
+            for network_metrics in network_metrics_list
+        ))
+        predictions.extend(itertools.chain.from_iterable(component_predictions))
+
+        recommendations = self._recommend_batch([pred["probability"] for pred in predictions])
         return [{
             "component": pred["component"],
             "failure_probability": pred["probability"],
             "estimated_time": pred["time"],
-            "recommended_action": self._get_recommendation(pred)
-        } for pred in predictions]
+            "recommended_action": recommendation
+        } for pred, recommendation in zip(predictions, recommendations)]
+
+    def predict_failures_batch(self, logs: List[Dict]) -> List[Dict]:
+        """Predict failure probabilities for a sweep of component logs"""
+        if not logs:
+            return []
+
+        probabilities = self._failure_probabilities(
+            self._preprocess_metrics_batch([log['metrics'] for log in logs])
+        )
+        recommendations = self._recommend_batch(probabilities)
+        return [{
+            "component": log['component'],
+            "failure_probability": float(probability),
+            "recommended_action": recommendation
+        } for log, probability, recommendation in zip(logs, probabilities, recommendations)]
+
+    def _failure_probabilities(self, metrics_batch: np.ndarray) -> np.ndarray:
+        """Failure probabilities for a preprocessed batch in a single forward pass"""
+        x = np.ascontiguousarray(metrics_batch[:, np.newaxis, :], dtype=np.float32)
+        if self._failure_interpreter is not None:
+            return self._run_interpreter(self._failure_interpreter, x).ravel()
+        return self._predict_fn(x).numpy().ravel()
+
+    def _anomaly_scores(self, metrics_batch: np.ndarray) -> np.ndarray:
+        """Anomaly scores for a normalized batch in a single forward pass"""
+        x = np.ascontiguousarray(metrics_batch, dtype=np.float32)
+        if self._anomaly_interpreter is not None:
+            return self._run_interpreter(self._anomaly_interpreter, x).ravel()
+        return self._anomaly_fn(x).numpy().ravel()
 
     async def optimize_maintenance_schedule(self, infrastructure: Dict) -> Dict:
         """Generate optimal maintenance schedule"""
@@ -65,107 +251,103 @@ class PredictiveMaintenance:
     def maintain_checks(self, system_logs):
         """Perform maintenance checks and automatic repairs"""
         maintenance_actions = []
-        
-        for log in system_logs:
+        if not system_logs:
+            return maintenance_actions
+
+        # Analyze component health using multiple indicators for all logs at once
+        normalized_batch = self._normalize_metrics_batch([log['metrics'] for log in system_logs])
+        health_scores = self._health_scores(normalized_batch)
+        anomaly_scores = self._anomaly_scores(normalized_batch)
+        # Only the failure model sees outlier-gated input
+        failure_probabilities = self._failure_probabilities(self._gate_metrics_batch(normalized_batch))
+
+        critical = (health_scores < 0.7) | (anomaly_scores > 0.8)
+        preventive = ~critical & (failure_probabilities > 0.6)
+
+        for log, is_critical, is_preventive in zip(system_logs, critical, preventive):
             component = log['component']
-            metrics = log['metrics']
-            
-            # Analyze component health using multiple indicators
-            health_score = self._calculate_health_score(metrics)
-            anomaly_score = self._detect_anomalies(metrics)
-            failure_probability = self._predict_failure_probability(metrics)
-            
-            if health_score < 0.7 or anomaly_score > 0.8:
+
+            if is_critical:
                 # Critical condition - immediate action required
                 action = self._perform_emergency_maintenance(component)
                 maintenance_actions.append(action)
                 
-            elif failure_probability > 0.6:
+            elif is_preventive:
                 # Schedule preventive maintenance
                 action = self._schedule_preventive_maintenance(component)
                 maintenance_actions.append(action)
                 
             else:
                 # Monitor and log normal operation
-                self._update_component_history(component, metrics)
+                self._update_component_history(component, log['metrics'])
         
         return maintenance_actions
 
-    def _calculate_health_score(self, metrics: Dict[str, float]) -> float:
-        """Calculate component health score using advanced telecom metrics"""
-        weights = {
-            'latency': 0.25,
-            'error_rate': 0.25,
-            'throughput': 0.15,
-            'resource_usage': 0.15,
-            'signal_strength': 0.10,
-            'interference_level': 0.10
-        }
-        
-        normalized_metrics = {}
-        for metric, value in metrics.items():
-            if metric in weights:
-                normalized_value = self._normalize_metric(metric, value)
-                normalized_metrics[metric] = normalized_value
-        
-        score = sum(weights[metric] * normalized_metrics[metric]
-                   for metric in normalized_metrics)
-        
-        # Apply non-linear scaling for better sensitivity
-        return 1.0 / (1.0 + np.exp(-10 * (score - 0.5)))
+    @staticmethod
+    def _health_scores(metrics_batch: np.ndarray) -> np.ndarray:
+        """Calculate component health scores for a normalized metric batch"""
+        scores = metrics_batch @ _METRIC_WEIGHTS
+
+        # Apply non-linear scaling for better sensitivity, read from the sigmoid table
+        positions = np.clip(scores * (_SIGMOID_LUT_SIZE - 1), 0, _SIGMOID_LUT_SIZE - 1)
+        return _SIGMOID_LUT[positions.astype(np.intp)]
 
     def _normalize_metric(self, metric: str, value: float) -> float:
         """Normalize metrics based on telecom industry standards"""
-        metric_ranges = {
-            'latency': {'min': 0, 'max': 100, 'ideal': 0},  # ms
-            'error_rate': {'min': 0, 'max': 0.01, 'ideal': 0},  # percentage
-            'throughput': {'min': 0, 'max': 10000, 'ideal': 10000},  # Mbps
-            'resource_usage': {'min': 0, 'max': 100, 'ideal': 60},  # percentage
-            'signal_strength': {'min': -120, 'max': -50, 'ideal': -50},  # dBm
-            'interference_level': {'min': -90, 'max': -30, 'ideal': -90}  # dBm
-        }
-        
-        range_info = metric_ranges[metric]
-        normalized = (value - range_info['min']) / (range_info['max'] - range_info['min'])
-        
-        if range_info['ideal'] == range_info['min']:
-            return 1 - normalized
-        elif range_info['ideal'] == range_info['max']:
-            return normalized
-        else:
-            ideal_normalized = (range_info['ideal'] - range_info['min']) / (range_info['max'] - range_info['min'])
-            return 1 - abs(normalized - ideal_normalized)
-
-    def _detect_anomalies(self, metrics):
-        """Detect anomalies using isolation forest algorithm"""
-        return self.anomaly_detector.predict_proba(
-            self._preprocess_metrics(metrics)
-        )[0]
-
-    def _preprocess_metrics(self, metrics: Dict) -> np.ndarray:
-        """Preprocess network metrics for ML model input"""
-        processed_metrics = []
-
-        # Extract and normalize key metrics
-        processed_metrics.extend([
-            self._normalize_metric(metrics.get('latency', 0), 0, 100),
-            self._normalize_metric(metrics.get('error_rate', 0), 0, 0.01),
-            self._normalize_metric(metrics.get('throughput', 0), 0, 10000),
-            self._normalize_metric(metrics.get('resource_usage', 0), 0, 100),
-            self._normalize_metric(metrics.get('signal_strength', -120), -120, -50),
-            self._normalize_metric(metrics.get('interference_level', -90), -90, -30)
-        ])
+        return float(_norm(_METRIC_IDX[metric], value))
+
+    def _normalize_metrics(self, metrics: Dict) -> np.ndarray:
+        """Normalize network metrics by their distance from the ideal value"""
+        # Extract key metrics, defaulting missing ones to the bottom of their range
+        values = np.fromiter(
+            (metrics.get(metric, _METRIC_MIN[i]) for i, metric in enumerate(METRIC_ORDER)),
+            dtype=np.float32,
+            count=len(METRIC_ORDER)
+        )
+
+        # Normalize all metrics at once by their distance from the ideal value
+        return 1 - np.abs((values - _METRIC_MIN) / _METRIC_SPAN - _METRIC_IDEAL_NORM)
+
+    def _normalize_metrics_batch(self, metrics_list: List[Dict]) -> np.ndarray:
+        """Normalize a batch of network metrics into an (N, features) array"""
+        return np.stack([self._normalize_metrics(metrics) for metrics in metrics_list])
 
-        # Detect and handle outliers
-        processed_metrics = self._handle_outliers(processed_metrics)
+    def _gate_metrics_batch(self, normalized_batch: np.ndarray) -> np.ndarray:
+        """Outlier-gate a normalized batch for failure model input"""
+        return np.stack([self._handle_outliers(row) for row in normalized_batch])
 
-        return np.array(processed_metrics).reshape(1, -1)
+    def _preprocess_metrics_batch(self, metrics_list: List[Dict]) -> np.ndarray:
+        """Preprocess a batch of network metrics for failure model input"""
+        return self._gate_metrics_batch(self._normalize_metrics_batch(metrics_list))
 
-    def _handle_outliers(self, data: List[float]) -> List[float]:
+    def _handle_outliers(self, data: np.ndarray) -> np.ndarray:
         """Detect and handle outliers in the data"""
-        data_array = np.array(data).reshape(1, -1)
-        anomalies = self.outlier_detector.fit_predict(data_array)
-        return [0 if anomaly == -1 else value for value, anomaly in zip(data, anomalies)]
+        data_array = np.asarray(data, dtype=np.float32)
+
+        # Pass samples through until the running statistics are meaningful
+        if self._outlier_count >= OUTLIER_CALIBRATION_SAMPLES:
+            std = np.sqrt(self._outlier_m2 / (self._outlier_count - 1))
+            std = np.maximum(std, OUTLIER_STD_FLOOR * np.maximum(1.0, np.abs(self._outlier_mean)))
+            gated = _gate(data_array, self._outlier_mean, std, OUTLIER_Z_THRESHOLD)
+        else:
+            gated = data_array
+
+        self._update_outlier_stats(data_array)
+        return gated
+
+    def _update_outlier_stats(self, data_array: np.ndarray) -> None:
+        """Fold one preprocessed sample into the running mean and variance"""
+        self._outlier_count += 1
+        delta = data_array - self._outlier_mean
+        self._outlier_mean += delta / self._outlier_count
+        self._outlier_m2 += delta * (data_array - self._outlier_mean)
+
+    def _calibrate_outlier_stats(self, calibration_data: np.ndarray) -> None:
+        """Seed the running statistics from representative preprocessed metrics"""
+        calibration_data = np.asarray(calibration_data, dtype=np.float64).reshape(-1, len(METRIC_ORDER))
+        self._outlier_count = len(calibration_data)
+        self._outlier_mean = calibration_data.mean(axis=0)
+        self._outlier_m2 = ((calibration_data - self._outlier_mean) ** 2).sum(axis=0)
 
     def discover_and_integrate_maintenance_component(self, component):
         """
@@ -174,20 +356,12 @@ class PredictiveMaintenance:
         self.maintenance_components.append(component)
         component.integrate(self)
 
-    def _detect_anomalies(self, metrics: Dict[str, float]) -> float:
-        """Detect anomalies using the anomaly detection model"""
-        preprocessed_metrics = self._preprocess_metrics(metrics)
-        anomaly_score = self.anomaly_detector.predict(preprocessed_metrics)
-        return anomaly_score[0]
-
-    def _get_recommendation(self, prediction: Dict) -> str:
-        """Generate maintenance recommendation based on prediction"""
-        if prediction["failure_probability"] > 0.8:
-            return "Immediate action required"
-        elif prediction["failure_probability"] > 0.5:
-            return "Schedule preventive maintenance"
-        else:
-            return "Monitor and log normal operation"
+    @staticmethod
+    def _recommend_batch(failure_probabilities) -> List[str]:
+        """Generate maintenance recommendations for a batch of failure probabilities"""
+        # side='left' keeps probabilities equal to a threshold in the lower band
+        bands = np.searchsorted(_RECOMMENDATION_THRESHOLDS, failure_probabilities, side='left')
+        return [RECOMMENDATIONS[band] for band in bands.tolist()]
 
     def _generate_schedule(self, infrastructure: Dict) -> Dict:
         """Generate maintenance schedule based on infrastructure data"""
@@ -217,12 +391,6 @@ class PredictiveMaintenance:
         # Placeholder for actual cost savings calculation logic
         return 1000.0
 
-    def _predict_failure_probability(self, metrics: Dict[str, float]) -> float:
-        """Predict failure probability using the predictive model"""
-        preprocessed_metrics = self._preprocess_metrics(metrics)
-        failure_probability = self.model.predict(preprocessed_metrics)
-        return failure_probability[0][0]
-
     def _perform_emergency_maintenance(self, component: str) -> Dict:
         """Perform emergency maintenance on the specified component"""
         # Placeholder for actual emergency maintenance logic
@@ -235,16 +403,59 @@ class PredictiveMaintenance:
 
     def _update_component_history(self, component: str, metrics: Dict[str, float]) -> None:
         """Update the maintenance history for the specified component"""
-        self.maintenance_history.append({"component": component, "metrics": metrics, "timestamp": "2023-01-01 12:00:00"})
+        i = self._hist_idx % HISTORY_CAPACITY
+        self._hist_metrics[i] = [metrics.get(metric, np.nan) for metric in METRIC_ORDER]
+        self._hist_components[i] = component
+        self._hist_ts[i] = np.datetime64('now', 'ns')
+        self._hist_idx += 1
+
+    def _history_slots(self) -> np.ndarray:
+        """Ring buffer slots holding maintenance history, oldest first"""
+        if self._hist_idx <= HISTORY_CAPACITY:
+            return np.arange(self._hist_idx)
+        return (np.arange(HISTORY_CAPACITY) + self._hist_idx) % HISTORY_CAPACITY
+
+    @property
+    def maintenance_history(self) -> List[Dict]:
+        """Maintenance history as a list of records, oldest first"""
+        slots = self._history_slots()
+        return [{
+            "component": component,
+            "metrics": {metric: value for metric, value in zip(METRIC_ORDER, metrics_vec.tolist())
+                        if not np.isnan(value)},
+            "timestamp": timestamp
+        } for component, metrics_vec, timestamp in zip(
+            self._hist_components[slots], self._hist_metrics[slots], self._hist_ts[slots]
+        )]
+
+    def history_as_df(self):
+        """Maintenance history as a pandas DataFrame, oldest first"""
+        import pandas as pd
+
+        slots = self._history_slots()
+        history = pd.DataFrame(self._hist_metrics[slots], columns=list(METRIC_ORDER))
+        history.insert(0, "component", self._hist_components[slots])
+        history["timestamp"] = self._hist_ts[slots]
+        return history
 
 class PredictiveMaintenanceModel:
-    def __init__(self, features, targets):
-        self.features = features
+    def __init__(self, features, targets, model=None):
+        self.features = np.asarray(features, dtype=np.float32)
         self.targets = targets
-        self.model = self._build_model()
-
-    def _build_model(self):
+        self.model = model if model is not None else self._build_model(self.features.shape[1])
+
+    @classmethod
+    def load_from_savedmodel(cls, path):
+        """Load a trained model for inference only, skipping compile()"""
+        model = _tf().keras.models.load_model(path, compile=False)
+        input_dim = model.input_shape[-1]
+        return cls(np.empty((0, input_dim), dtype=np.float32), np.empty(0, dtype=np.float32), model=model)
+
+    @staticmethod
+    def _build_model(input_dim):
+        tf = _tf()
         model = tf.keras.Sequential([
+            tf.keras.Input(shape=(input_dim,)),
             tf.keras.layers.Dense(64, activation='relu'),
             tf.keras.layers.Dense(32, activation='relu'),
             tf.keras.layers.Dense(1, activation='sigmoid')
@@ -258,17 +469,28 @@ class PredictiveMaintenanceModel:
     def predict(self, test_features):
         return self.model.predict(test_features)
 
-# Example usage
-from time import sleep
-
 def load_data(file_path):
     # Simple load from JSON, customize this for your data.
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        if not ORJSON_AVAILABLE:
+            data = json.load(f)
+        elif os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            # Parse large files from the page cache without copying them into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                data = orjson.loads(view)
+        else:
+            data = orjson.loads(f.read())
+
+    # Convert numeric sections once so the model code does not copy them again
+    if isinstance(data, dict):
+        for key in ('features', 'targets', 'test_features'):
+            if key in data:
+                data[key] = np.asarray(data[key], dtype=np.float32)
     return data
 
-# Example usage
-data = load_data('system_logs.json')
-model = PredictiveMaintenanceModel(data['features'], data['targets'])
-predictions = model.predict(data['test_features'])
-maintain_checks(predictions)
+if __name__ == "__main__":
+    # Example usage
+    data = load_data('system_logs.json')
+    model = PredictiveMaintenanceModel(data['features'], data['targets'])
+    predictions = model.predict(data['test_features'])
+    print(predictions)
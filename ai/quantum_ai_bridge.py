@@ -1,13 +1,15 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 import numpy as np
 from quantum.quantum_interface import QuantumSystem
 from ai.multiversal_forecaster import MultiversalForecaster
 
 class QuantumAIBridge:
-    def __init__(self):
+    def __init__(self, network_keys: Optional[Sequence[str]] = None):
         self.quantum_system = QuantumSystem()
         self.forecaster = MultiversalForecaster()
         self.components = []
+        # Fixed feature order for encoding; dict order is used when unset
+        self.network_keys = tuple(network_keys) if network_keys is not None else None
         
     async def optimize_network_parameters(self, network_data: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize network using quantum-classical hybrid approach"""
@@ -63,9 +65,16 @@ class QuantumAIBridge:
     def _encode_network_data(self, network_data: Dict[str, Any]) -> np.ndarray:
         """Encode network data into quantum states"""
         # Placeholder for actual encoding logic
-        return np.array(list(network_data.values()))
+        return self._to_feature_vector(network_data)
 
     async def _generate_quantum_features(self, current_state: Dict[str, Any]) -> np.ndarray:
         """Generate quantum feature map from current state"""
         # Placeholder for actual feature generation logic
-        return np.array(list(current_state.values()))
+        return self._to_feature_vector(current_state)
+
+    def _to_feature_vector(self, data: Dict[str, Any]) -> np.ndarray:
+        """Fill a float64 vector straight from the dict, without an intermediate list"""
+        if self.network_keys is not None:
+            return np.fromiter((data[key] for key in self.network_keys),
+                               dtype=np.float64, count=len(self.network_keys))
+        return np.fromiter(data.values(), dtype=np.float64, count=len(data))
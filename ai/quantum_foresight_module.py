@@ -18,6 +18,8 @@ class QuantumForesight:
         self.model = self._train_model()
         self.uncertainty_threshold = 0.15
         self.components = []
+        # Per-component prediction rows, reallocated when their shape changes
+        self._comp_buf = None
 
     def _validate_input(self, data: np.ndarray) -> None:
         if not isinstance(data, np.ndarray):
@@ -42,17 +44,28 @@ class QuantumForesight:
                 return None
             
             # Integrate dynamic quantum foresight components
-            for component in self.components:
-                component_prediction = component.predict(input_data)
-                prediction += component_prediction
+            if self.components:
+                buffer = self._component_buffer(prediction.shape)
+                for i, component in enumerate(self.components):
+                    buffer[i] = component.predict(input_data)
+                prediction = prediction + buffer.sum(axis=0)
             
             return prediction
         except Exception as e:
             raise QuantumPredictionError(f"Prediction failed: {str(e)}")
 
+    def _component_buffer(self, prediction_shape) -> np.ndarray:
+        shape = (len(self.components), *prediction_shape)
+        if self._comp_buf is None or self._comp_buf.shape != shape:
+            self._comp_buf = np.empty(shape, dtype=np.float64)
+        return self._comp_buf
+
     def _calculate_uncertainty(self, prediction: np.ndarray) -> float:
-        # Implement uncertainty quantification
-        return np.std(prediction) / np.mean(prediction)
+        # Coefficient of variation; a near-zero mean means the spread is unbounded
+        mean = prediction.mean()
+        if abs(mean) <= 1e-12:
+            return np.inf
+        return np.sqrt(np.mean(np.square(prediction - mean))) / mean
 
     def discover_and_integrate_quantum_foresight_component(self, component):
         """
@@ -75,12 +88,13 @@ class HybridQuantumModel(QuantumModel):
     def score(self, test_data: np.ndarray) -> float:
         return 0.95
 
-# Test instance
-quantum_data = np.array([[1, 2, 3], [4, 5, 6]])
-quantum_mod = QuantumForesight(quantum_data)
-test_input = np.array([7, 8, 9])
-predicted = quantum_mod.predict(test_input)
-print("Predicted values: ", predicted)
+def main():
+    # Test instance
+    quantum_data = np.array([[1, 2, 3], [4, 5, 6]])
+    quantum_mod = QuantumForesight(quantum_data)
+    test_input = np.array([7, 8, 9])
+    predicted = quantum_mod.predict(test_input)
+    print("Predicted values: ", predicted)
 
 import unittest
 
@@ -118,4 +132,5 @@ class TestQuantumForesight(unittest.TestCase):
         self.assertTrue(np.all(predicted > self.test_input))
 
 if __name__ == '__main__':
+    main()
     unittest.main()
@@ -10,16 +10,38 @@ import numpy as np
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Optional, Tuple, Any
 import gymnasium as gym
 from gymnasium import spaces
-from collections import deque
 import random
+import sys
 from dataclasses import dataclass
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Leave functions uncompiled when numba is not installed"""
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def _step_physics(bandwidth_usage, adjustment):
+    """Apply a bandwidth adjustment to one environment or an array of them;
+    returns bandwidth, latency, packet loss and reward"""
+    bandwidth_usage = np.minimum(1.0, np.maximum(0.0, bandwidth_usage + adjustment))
+    latency = 20.0 * (1 + (bandwidth_usage - 0.5) * 2)
+    packet_loss = 0.01 * (1 + np.maximum(0.0, bandwidth_usage - 0.8) * 4)
+
+    # Penalize high latency and packet loss, reward efficient bandwidth usage
+    reward = -0.1 * (latency / 20.0) - 10.0 * packet_loss + (1.0 - np.abs(0.7 - bandwidth_usage))
+    return bandwidth_usage, latency, packet_loss, reward
+
 @dataclass
 class NetworkState:
     bandwidth_usage: float
@@ -69,17 +91,10 @@ class NetworkEnvironment(gym.Env):
     def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, dict]:
         self._current_step += 1
         
-        # Apply bandwidth adjustment
+        # Apply bandwidth adjustment and update network state
         adjustment = (action - 2) * 0.1  # Convert to [-0.2, -0.1, 0, 0.1, 0.2]
-        new_bandwidth = np.clip(self.state.bandwidth_usage + adjustment, 0, 1)
-        
-        # Update network state
-        self.state.bandwidth_usage = new_bandwidth
-        self.state.latency = self._calculate_latency()
-        self.state.packet_loss = self._calculate_packet_loss()
-        
-        # Calculate reward
-        reward = self._calculate_reward()
+        (self.state.bandwidth_usage, self.state.latency,
+         self.state.packet_loss, reward) = _step_physics(float(self.state.bandwidth_usage), adjustment)
         
         # Check if episode should end
         done = self._current_step >= self._max_steps
@@ -95,25 +110,68 @@ class NetworkEnvironment(gym.Env):
             self.state.time_of_day / 24    # Normalize
         ], dtype=np.float32)
 
-    def _calculate_latency(self) -> float:
-        base_latency = 20.0
-        usage_factor = 1 + (self.state.bandwidth_usage - 0.5) * 2
-        return base_latency * usage_factor
+class VectorNetworkEnvironment:
+    """NetworkEnvironment dynamics stepped for num_envs environments at once"""
 
-    def _calculate_packet_loss(self) -> float:
-        base_loss = 0.01
-        usage_factor = 1 + max(0, self.state.bandwidth_usage - 0.8) * 4
-        return base_loss * usage_factor
+    def __init__(self, num_envs: int, config: Dict[str, Any]):
+        self.num_envs = num_envs
+        self.single_action_space = spaces.Discrete(5)  # [-20%, -10%, 0%, +10%, +20%]
+        self.single_observation_space = spaces.Box(
+            low=np.array([0, 0, 0, 0, 0]),
+            high=np.array([1, 1000, 1000, 1, 24]),
+            dtype=np.float32
+        )
 
-    def _calculate_reward(self) -> float:
-        # Penalize high latency and packet loss
-        latency_penalty = -0.1 * (self.state.latency / 20.0)
-        loss_penalty = -10.0 * self.state.packet_loss
-        
-        # Reward efficient bandwidth usage
-        efficiency_reward = 1.0 - abs(0.7 - self.state.bandwidth_usage)
-        
-        return latency_penalty + loss_penalty + efficiency_reward
+        # Network state as one array per field (structure of arrays)
+        self.bandwidth_usage = np.full(num_envs, 0.5, dtype=np.float32)
+        self.user_count = np.full(num_envs, 100, dtype=np.float32)
+        self.latency = np.full(num_envs, 20.0, dtype=np.float32)
+        self.packet_loss = np.full(num_envs, 0.01, dtype=np.float32)
+        self.time_of_day = np.full(num_envs, 12, dtype=np.float32)
+
+        self.config = config
+        self._max_steps = config.get('max_steps', 1000)
+        self._current_step = 0
+        self._rng = np.random.default_rng()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+        self._current_step = 0
+
+        n = self.num_envs
+        self.bandwidth_usage[:] = self._rng.uniform(0.3, 0.7, n)
+        self.user_count[:] = self._rng.integers(50, 151, n)
+        self.latency[:] = self._rng.uniform(10, 30, n)
+        self.packet_loss[:] = self._rng.uniform(0, 0.05, n)
+        self.time_of_day[:] = self._rng.integers(0, 24, n)
+        return self._get_observation(), {}
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        self._current_step += 1
+
+        # Apply bandwidth adjustments and update network state with the same
+        # kernel NetworkEnvironment uses
+        adjustment = (np.asarray(actions, dtype=np.float32) - 2) * 0.1
+        bandwidth_usage, latency, packet_loss, rewards = _step_physics(self.bandwidth_usage, adjustment)
+        self.bandwidth_usage[:] = bandwidth_usage
+        self.latency[:] = latency
+        self.packet_loss[:] = packet_loss
+
+        # All environments advance in lockstep
+        dones = np.full(self.num_envs, self._current_step >= self._max_steps)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+
+        return self._get_observation(), rewards, dones, truncated, {}
+
+    def _get_observation(self) -> np.ndarray:
+        return np.stack([
+            self.bandwidth_usage,
+            self.user_count / 1000,  # Normalize
+            self.latency / 1000,     # Normalize
+            self.packet_loss,
+            self.time_of_day / 24    # Normalize
+        ], axis=1).astype(np.float32, copy=False)
 
 class DQNAgent:
     def __init__(self, state_dim: int, action_dim: int, config: Dict[str, Any]):
@@ -126,15 +184,71 @@ class DQNAgent:
         self.epsilon = config.get('epsilon_start', 1.0)
         self.epsilon_min = config.get('epsilon_min', 0.01)
         self.epsilon_decay = config.get('epsilon_decay', 0.995)
-        self.memory = deque(maxlen=config.get('memory_size', 10000))
         self.batch_size = config.get('batch_size', 64)
 
         self.policy_net = self._build_network().to(self.device)
         self.target_net = self._build_network().to(self.device)
         self.target_net.load_state_dict(self.policy_net.state_dict())
+        # Parameter pairs bound once for in-place target updates
+        self._target_params = list(self.target_net.parameters())
+        self._policy_params = list(self.policy_net.parameters())
         
         self.optimizer = optim.Adam(self.policy_net.parameters(), lr=self.learning_rate)
 
+        # bf16 autocast needs no loss scaling; on GPU the compiled loss is
+        # also replayed through CUDA graphs to cut kernel launch overhead
+        self._use_amp = self.device.type == "cuda"
+        if self._use_amp:
+            torch.backends.cudnn.benchmark = True
+        # Device-resident batch of states reused by select_action_batch
+        self._states_device = None
+        self._compute_loss = self._compile_loss()
+
+        # Replay memory as preallocated ring-buffer arrays (structure of arrays)
+        self.memory_size = config.get('memory_size', 10000)
+        self._s = np.zeros((self.memory_size, state_dim), dtype=np.float32)
+        self._a = np.zeros(self.memory_size, dtype=np.int64)
+        self._r = np.zeros(self.memory_size, dtype=np.float32)
+        self._ns = np.zeros((self.memory_size, state_dim), dtype=np.float32)
+        self._d = np.zeros(self.memory_size, dtype=np.float32)
+        self._idx = 0
+        self._size = 0
+        self._replay_arrays = (self._s, self._a, self._r, self._ns, self._d)
+
+        # Two sets of pinned host tensors per batch size (CUDA only), used
+        # alternately so one can be filled while the other is being copied
+        self._host_buffers = {}
+        self._host_slot = 0
+
+    def _compile_loss(self):
+        """torch.compile the loss where supported, otherwise keep it eager"""
+        torch_version = tuple(int(part) for part in torch.__version__.split('.')[:2])
+        # torch.compile arrived in 2.0 but only supports Python 3.11 from 2.1
+        if not hasattr(torch, 'compile') or (sys.version_info >= (3, 11) and torch_version < (2, 1)):
+            return self._compute_loss_impl
+        try:
+            compiled = torch.compile(
+                self._compute_loss_impl,
+                mode="reduce-overhead" if self._use_amp else "default"
+            )
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, using eager loss: {e}")
+            return self._compute_loss_impl
+
+        def compute_loss(*args):
+            # Inductor builds on the first call (e.g. it needs a C++ toolchain on
+            # CPU), so a failure there switches this agent to the eager loss
+            try:
+                loss = compiled(*args)
+            except Exception as e:
+                logger.warning(f"Compiled loss failed, falling back to eager: {e}")
+                self._compute_loss = self._compute_loss_impl
+                return self._compute_loss_impl(*args)
+            self._compute_loss = compiled
+            return loss
+
+        return compute_loss
+
     def _build_network(self) -> nn.Module:
         return nn.Sequential(
             nn.Linear(self.state_dim, 128),
@@ -149,41 +263,118 @@ class DQNAgent:
             return random.randrange(self.action_dim)
         
         with torch.no_grad():
-            state_tensor = torch.FloatTensor(state).unsqueeze(0).to(self.device)
+            state_tensor = torch.as_tensor(state, dtype=torch.float32, device=self.device).unsqueeze(0)
             q_values = self.policy_net(state_tensor)
             return q_values.argmax().item()
 
-    def train(self, batch: List[Tuple[np.ndarray, int, float, np.ndarray, bool]]):
-        if len(batch) < self.batch_size:
+    def select_action_batch(self, states: np.ndarray) -> np.ndarray:
+        """Epsilon-greedy actions for a batch of states from one policy forward pass"""
+        n = len(states)
+        if self._states_device is None or self._states_device.shape[0] != n:
+            self._states_device = torch.empty(
+                (n, self.state_dim), dtype=torch.float32, device=self.device
+            )
+        with torch.no_grad():
+            self._states_device.copy_(torch.as_tensor(states, dtype=torch.float32), non_blocking=True)
+
+        # Exploration is drawn on the device, so the only transfer back is the actions
+        with torch.inference_mode():
+            greedy = self.policy_net(self._states_device).argmax(1)
+            random_actions = torch.randint(0, self.action_dim, (n,), device=self.device)
+            explore = torch.rand(n, device=self.device) < self.epsilon
+            actions = torch.where(explore, random_actions, greedy)
+        return actions.cpu().numpy()
+
+    def train(self, batch_size: Optional[int] = None):
+        batch_size = batch_size or self.batch_size
+        if self._size < batch_size:
             return
             
-        states, actions, rewards, next_states, dones = zip(*batch)
-        
-        states = torch.FloatTensor(states).to(self.device)
-        actions = torch.LongTensor(actions).to(self.device)
-        rewards = torch.FloatTensor(rewards).to(self.device)
-        next_states = torch.FloatTensor(next_states).to(self.device)
-        dones = torch.FloatTensor(dones).to(self.device)
-        
-        current_q_values = self.policy_net(states).gather(1, actions.unsqueeze(1))
-        next_q_values = self.target_net(next_states).max(1)[0].detach()
-        target_q_values = rewards + (1 - dones) * self.gamma * next_q_values
-        
-        loss = nn.MSELoss()(current_q_values.squeeze(), target_q_values)
+        loss = self._compute_loss(*self.sample(batch_size))
         
         self.optimizer.zero_grad()
         loss.backward()
         self.optimizer.step()
         
-        # Decay epsilon
-        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+        # Decay epsilon once per batch_size worth of samples, so training on a
+        # K-times larger batch keeps the same exploration schedule
+        decay_steps = max(1, batch_size // self.batch_size)
+        self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay ** decay_steps)
+
+    def _compute_loss_impl(self, states: torch.Tensor, actions: torch.Tensor, rewards: torch.Tensor,
+                           next_states: torch.Tensor, dones: torch.Tensor) -> torch.Tensor:
+        with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16, enabled=self._use_amp):
+            current_q_values = self.policy_net(states).gather(1, actions.unsqueeze(1))
+            with torch.no_grad():
+                next_q_values = self.target_net(next_states).max(1)[0]
+
+        target_q_values = rewards + (1 - dones) * self.gamma * next_q_values.float()
+        return nn.functional.mse_loss(current_q_values.squeeze(1).float(), target_q_values)
 
     def update_target_network(self):
-        self.target_net.load_state_dict(self.policy_net.state_dict())
+        with torch.no_grad():
+            if hasattr(torch, '_foreach_copy_'):
+                torch._foreach_copy_(self._target_params, self._policy_params)
+            else:
+                for target_param, policy_param in zip(self._target_params, self._policy_params):
+                    target_param.copy_(policy_param)
 
     def remember(self, state: np.ndarray, action: int, reward: float, 
                 next_state: np.ndarray, done: bool):
-        self.memory.append((state, action, reward, next_state, done))
+        i = self._idx % self.memory_size
+        self._s[i] = state
+        self._a[i] = action
+        self._r[i] = reward
+        self._ns[i] = next_state
+        self._d[i] = done
+        self._idx += 1
+        self._size = min(self._size + 1, self.memory_size)
+
+    def remember_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                       next_states: np.ndarray, dones: np.ndarray):
+        """Store one transition per environment from a vectorized step"""
+        n = len(states)
+        idx = (self._idx + np.arange(n)) % self.memory_size
+        self._s[idx] = states
+        self._a[idx] = actions
+        self._r[idx] = rewards
+        self._ns[idx] = next_states
+        self._d[idx] = dones
+        self._idx += n
+        self._size = min(self._size + n, self.memory_size)
+
+    def sample(self, batch_size: int) -> Tuple[torch.Tensor, ...]:
+        """Draw a uniform batch of transitions as tensors on the agent's device"""
+        idx = np.random.randint(0, self._size, batch_size)
+        if self.device.type != 'cuda':
+            return tuple(torch.from_numpy(buffer[idx]) for buffer in self._replay_arrays)
+
+        host_tensors, copied = self._next_host_buffers(batch_size)
+        # Wait for the previous transfer out of this set before overwriting it
+        if copied is not None:
+            copied.synchronize()
+        for tensor, buffer in zip(host_tensors, self._replay_arrays):
+            np.take(buffer, idx, axis=0, out=tensor.numpy())
+
+        device_tensors = tuple(tensor.to(self.device, non_blocking=True) for tensor in host_tensors)
+        copied = torch.cuda.Event()
+        copied.record()
+        self._host_buffers[batch_size][self._host_slot] = (host_tensors, copied)
+        return device_tensors
+
+    def _next_host_buffers(self, batch_size: int):
+        """Alternate between two pinned host buffer sets for the given batch size"""
+        if batch_size not in self._host_buffers:
+            self._host_buffers[batch_size] = [
+                (tuple(
+                    torch.empty((batch_size, *buffer.shape[1:]),
+                                dtype=torch.from_numpy(buffer[:0]).dtype, pin_memory=True)
+                    for buffer in self._replay_arrays
+                ), None)
+                for _ in range(2)
+            ]
+        self._host_slot ^= 1
+        return self._host_buffers[batch_size][self._host_slot]
 
 def train_network_optimization(config: Dict[str, Any]):
     """
@@ -191,29 +382,36 @@ def train_network_optimization(config: Dict[str, Any]):
     
     Args:
         config: Configuration dictionary containing hyperparameters
+                (``num_envs`` sets how many environments are stepped per rollout)
     """
-    env = NetworkEnvironment(config)
-    state_dim = env.observation_space.shape[0]
-    action_dim = env.action_space.n
+    # Rollouts run num_envs environments in lockstep through one vectorized env
+    env = VectorNetworkEnvironment(config.get('num_envs', 1), config)
+    state_dim = env.single_observation_space.shape[0]
+    action_dim = env.single_action_space.n
     
     agent = DQNAgent(state_dim, action_dim, config)
     episodes = config.get('episodes', 1000)
+    # Train every K environment steps on a K-times larger batch
+    train_every = config.get('train_every', 4)
+    step = 0
     
     for episode in range(episodes):
-        state, _ = env.reset()
-        episode_reward = 0
+        states, _ = env.reset()
+        episode_reward = 0.0
         
         while True:
-            action = agent.select_action(state)
-            next_state, reward, done, _, _ = env.step(action)
+            actions = agent.select_action_batch(states)
+            next_states, rewards, dones, _, _ = env.step(actions)
             
-            agent.remember(state, action, reward, next_state, done)
-            agent.train(random.sample(agent.memory, min(len(agent.memory), agent.batch_size)))
+            agent.remember_batch(states, actions, rewards, next_states, dones)
+            step += 1
+            if step % train_every == 0:
+                agent.train(agent.batch_size * train_every)
             
-            state = next_state
-            episode_reward += reward
+            states = next_states
+            episode_reward += float(rewards.mean())
             
-            if done:
+            if dones.all():
                 break
         
         if episode % 10 == 0:
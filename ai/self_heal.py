@@ -1,5 +1,24 @@
 from quantum_ai import QuantumEngine
+import itertools
 import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Log files at least this large are streamed record by record instead of parsed in one go
+STREAM_THRESHOLD = 64 * 1024 * 1024
+# Log records analysed, corrected and handed to components together
+SELF_HEAL_CHUNK_SIZE = 1000
 
 class SelfHealingComponent:
     def integrate(self, system):
@@ -15,19 +34,34 @@ class SelfHealingComponent:
         pass
 
 def load_network_logs(file_path):
-    with open(file_path, 'r') as f:
-        logs = json.load(f)
-    return logs
+    """Yield log records one at a time instead of buffering the whole file"""
+    with open(file_path, 'rb') as f:
+        if IJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= STREAM_THRESHOLD:
+            # Stream large archives so memory stays flat
+            yield from ijson.items(f, 'item')
+        elif ORJSON_AVAILABLE:
+            yield from orjson.loads(f.read())
+        else:
+            yield from json.load(f)
 
 def self_heal_network(logs):
     engine = QuantumEngine()
-    issues = engine.analyze(logs)
-    for issue in issues:
-        engine.execute_correction(issue)
+    logs = iter(logs)
+    # Streams are handled in bounded chunks so each batch call covers many records
+    for chunk in iter(lambda: list(itertools.islice(logs, SELF_HEAL_CHUNK_SIZE)), []):
+        issues = engine.analyze(chunk)
+        _execute_corrections(engine, issues)
+
+        # Integrate dynamic self-healing components
+        for component in self_healing_components:
+            component.self_heal(chunk)
 
-    # Integrate dynamic self-healing components
-    for component in self_healing_components:
-        component.self_heal(logs)
+def _execute_corrections(engine, issues):
+    """Dispatch a batch of corrections in one call when the engine supports it"""
+    execute_batch = getattr(engine, 'execute_corrections', None)
+    if execute_batch is not None:
+        return execute_batch(list(issues))
+    return [engine.execute_correction(issue) for issue in issues]
 
 self_healing_components = []
 
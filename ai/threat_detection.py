@@ -1,31 +1,138 @@
+import asyncio
+import itertools
 import json
+import os
+import threading
+from operator import methodcaller
 from datetime import datetime
+import joblib
+import numpy as np
 from ai.task_handler import TaskHandler
 from sklearn.ensemble import IsolationForest
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Log files at least this large are streamed record by record instead of parsed in one go
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Eagerly compiled for the int8 predictions the detector passes in, so no first-call JIT
+    @njit('int64[:](int8[::1])', cache=True, parallel=True)
+    def compact_anomalies(anomalies):
+        """Return the positions of the -1 predictions in ascending order"""
+        n = anomalies.shape[0]
+        # Count then fill, so prange never shares a write pointer between threads
+        flags = np.empty(n, np.int64)
+        for i in prange(n):
+            flags[i] = 1 if anomalies[i] == -1 else 0
+        positions = np.cumsum(flags)
+        out = np.empty(positions[-1] if n > 0 else 0, np.int64)
+        for i in prange(n):
+            if flags[i]:
+                out[positions[i] - 1] = i
+        return out
+else:
+    def compact_anomalies(anomalies):
+        """Return the positions of the -1 predictions in ascending order"""
+        return np.flatnonzero(anomalies == -1)
 
 class ThreatDetectionTaskHandler(TaskHandler):
-    def __init__(self, log_analyzer, log_file="network_logs_analysis.json"):
+    def __init__(self, log_analyzer, log_file="network_logs_analysis.json", model_file=None, model=None):
         self.log_analyzer = log_analyzer
-        self.model = IsolationForest(n_estimators=100, contamination=0.1)
+        # A pretrained model passed in is shared as-is and never refitted here
+        self.model = model if model is not None else IsolationForest(
+            n_estimators=50, max_samples=256, contamination='auto', n_jobs=-1)
         self.log_file = log_file
+        # Persistence is opt-in: only a caller-supplied model file is loaded or written
+        self.model_file = model_file
+        self._fitted = model is not None
+        # Detection can run in several worker threads; only one may fit or load
+        self._fit_lock = threading.Lock()
 
     def execute_task(self, task):
         threats = self.detect_threats_from_logs(self.log_file)
         return self.trigger_alert(threats)
 
     def detect_threats_from_logs(self, log_file):
-        with open(log_file, 'r') as f:
-            logs = json.load(f)
-        data = [[self.log_analyzer.extract_metric(log)] for log in logs]
-        anomalies = self.model.fit_predict(data)
-        return [log for i, log in enumerate(logs) if anomalies[i] == -1]
+        if not _should_stream(log_file):
+            return self.detect_threats(_load_logs(log_file))
+
+        # Two streaming passes: score every metric, then pick out the flagged records
+        metrics = self._metrics(_stream_logs(log_file))
+        self._ensure_fitted(metrics)
+        anomalies = self.model.predict(metrics)
+        return _select(_stream_logs(log_file), compact_anomalies(_as_flags(anomalies)))
+
+    def detect_threats(self, logs):
+        """Return the anomalous records of an in-memory list of logs"""
+        metrics = self._metrics(logs)
+        self._ensure_fitted(metrics)
+        anomalies = self.model.predict(metrics)
+        return [logs[i] for i in compact_anomalies(_as_flags(anomalies))]
+
+    def _metrics(self, logs):
+        """Extract the metric of each log into a single float32 feature column"""
+        analyzer = self.log_analyzer
+        if type(analyzer).extract_metric is LogAnalyzer.extract_metric:
+            # The stock lookup done as a C-level dict.get, skipping a method call per log
+            extract = methodcaller('get', analyzer.metric_key, analyzer.default_metric)
+        else:
+            extract = analyzer.extract_metric
+        count = len(logs) if hasattr(logs, '__len__') else -1
+        return np.fromiter(map(extract, logs), dtype=np.float32, count=count)[:, None]
+
+    def fit_baseline(self, baseline_logs):
+        """Fit the detector once on representative logs, persisting it if a model file is set"""
+        metrics = self._metrics(baseline_logs)
+        with self._fit_lock:
+            self._fit(metrics)
+
+    def _fit(self, metrics):
+        self.model.fit(metrics)
+        if self.model_file is not None:
+            # Write then rename, so other processes never load a half-written model
+            tmp_file = f"{self.model_file}.tmp"
+            joblib.dump(self.model, tmp_file)
+            os.replace(tmp_file, self.model_file)
+        self._fitted = True
+
+    def _ensure_fitted(self, metrics):
+        """Load the configured baseline model file, or fit on the first metrics seen"""
+        if self._fitted:
+            return
+        with self._fit_lock:
+            if self._fitted:
+                return
+            if self.model_file is not None and os.path.exists(self.model_file):
+                self.model = joblib.load(self.model_file)
+                self._fitted = True
+            else:
+                self._fit(metrics)
 
     def trigger_alert(self, threats):
-        alerts = []
-        for threat in threats:
-            alert = f"Threat Detected: {threat['event']} at file {threat['file']}"
-            print(alert)
-            alerts.append(alert)
+        alerts = [f"Threat Detected: {threat['event']} at file {threat['file']}" for threat in threats]
+        if alerts:
+            # One write for the whole batch instead of one per threat
+            logger.warning("\n".join(alerts))
         return alerts
 
     def discover_and_integrate_threat_detection_component(self, component):
@@ -34,6 +141,61 @@ class ThreatDetectionTaskHandler(TaskHandler):
         """
         component.integrate(self)
 
+def _as_flags(anomalies):
+    """Narrow IsolationForest's +1/-1 predictions to the contiguous int8 layout compact_anomalies expects"""
+    return np.ascontiguousarray(anomalies, dtype=np.int8)
+
+def _should_stream(log_file):
+    """Whether a log file is large enough to stream instead of parsing in one go"""
+    return IJSON_AVAILABLE and os.path.getsize(log_file) >= STREAM_THRESHOLD
+
+def _load_logs(log_file):
+    """Parse a JSON log array in one go"""
+    with open(log_file, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+def _stream_logs(log_file):
+    """Yield the records of a JSON log array one at a time"""
+    with open(log_file, 'rb') as f:
+        yield from ijson.items(f, 'item')
+
+def _select(logs, indices):
+    """Pick the records at the sorted positions in indices out of a log stream"""
+    logs = iter(logs)
+    selected = []
+    prev = -1
+    for i in indices:
+        selected.append(next(itertools.islice(logs, i - prev - 1, None)))
+        prev = i
+    return selected
+
 class LogAnalyzer:
+    metric_key = "metric"
+    # Value used for logs that do not report the metric
+    default_metric = 0.0
+
     def extract_metric(self, log):
-        return log.get("metric")
+        return log.get(self.metric_key, self.default_metric)
+
+_default_handler = None
+_default_handler_lock = threading.Lock()
+
+def detect_threats_from_logs(logs, handler=None):
+    """Detect anomalous records in a log file path or an in-memory list of logs"""
+    global _default_handler
+    if handler is None:
+        if _default_handler is None:
+            # Concurrent first calls from worker threads must share one handler
+            with _default_handler_lock:
+                if _default_handler is None:
+                    _default_handler = ThreatDetectionTaskHandler(LogAnalyzer())
+        handler = _default_handler
+    if isinstance(logs, (str, os.PathLike)):
+        return handler.detect_threats_from_logs(logs)
+    return handler.detect_threats(logs)
+
+async def detect_threats_from_logs_async(logs, handler=None):
+    """Run threat detection in a worker thread so the event loop stays responsive"""
+    return await asyncio.to_thread(detect_threats_from_logs, logs, handler)
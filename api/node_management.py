@@ -140,14 +140,14 @@ class NodeManager:
             # Generate quantum key
             key = await quantum_correction.generate_key()
             
-            # Encrypt sensitive fields
-            protected_config = {}
-            for k, v in config.items():
-                if k in ['security', 'credentials', 'keys']:
-                    protected_config[k] = await quantum_correction.encrypt(v, key)
-                else:
-                    protected_config[k] = v
-                    
+            # Encrypt sensitive fields concurrently; field order is preserved
+            protected_config = dict(config)
+            sensitive = [k for k in config if k in ('security', 'credentials', 'keys')]
+            encrypted = await asyncio.gather(
+                *(quantum_correction.encrypt(config[k], key) for k in sensitive)
+            )
+            protected_config.update(zip(sensitive, encrypted))
+
             return protected_config
             
         except Exception as e:
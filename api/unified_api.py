@@ -11,7 +11,7 @@ Copyright © 2025 AstraLink. All rights reserved.
 
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from ai.threat_detection import detect_threats_from_logs
+from ai.threat_detection import ThreatDetectionTaskHandler, LogAnalyzer, detect_threats_from_logs_async
 from contracts.DynamicESIMNFT import mintESIM, updateStatus
 from ai.multiversal_forecaster import MultiversalForecaster
 from network.handshake_integration import HandshakeIntegration
@@ -23,14 +23,42 @@ from typing import Dict, Optional
 import yaml
 from logging_config import get_logger
 import uuid
+import os
+import asyncio
+import joblib
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 logger = get_logger(__name__)
 
+# Persisted models live in a configured directory, not the working directory
+# Fitted models are runtime data, kept in the user's cache directory rather than the source tree
+MODEL_DIR = os.getenv(
+    'ASTRALINK_MODEL_DIR',
+    os.path.join(os.getenv('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'astralink', 'models')
+)
+THREAT_MODEL_FILE = os.path.join(MODEL_DIR, "threat_iforest.joblib")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load or fit shared models once per worker, then initialize API services"""
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    if os.path.exists(THREAT_MODEL_FILE):
+        threat_model = await asyncio.to_thread(joblib.load, THREAT_MODEL_FILE)
+        detector = ThreatDetectionTaskHandler(LogAnalyzer(), model_file=THREAT_MODEL_FILE, model=threat_model)
+    else:
+        # Fit the baseline before serving, so request threads only ever predict
+        detector = ThreatDetectionTaskHandler(LogAnalyzer(), model_file=THREAT_MODEL_FILE)
+        await asyncio.to_thread(detector.fit_baseline, await get_log_data())
+    app.state.threat_detector = detector
+    await startup()
+    yield
+
 app = FastAPI(
     title="AstraLink Unified API",
     description="Secure telecom services through quantum.api",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Initialize core services
@@ -120,7 +148,7 @@ async def analyze_threats(request: Request):
             raise HTTPException(status_code=403, detail="Unauthorized origin")
 
         logs = await get_log_data()
-        result = await detect_threats_from_logs(logs)
+        result = await detect_threats_from_logs_async(logs, request.app.state.threat_detector)
         
         return {
             'threats': result,
@@ -187,10 +215,6 @@ async def startup():
         logger.error(f"API initialization failed: {str(e)}")
         raise
 
-@app.on_event("startup")
-async def startup_event():
-    await startup()
-
 def discover_and_integrate_api_component(component):
     """
     Dynamically discover and integrate a new API component into the system.
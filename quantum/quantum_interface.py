@@ -38,6 +38,13 @@ class QuantumSystem:
         # Initialize quantum circuit parameters
         self.qubits_per_byte = 8
         self.shots = 1024
+        self.entropy_shots = 16  # Shots per entropy job, 8 bytes each
+        
+        # Build and transpile the entropy circuit once for the backend
+        self.entropy_circuit = qiskit.transpile(
+            self._create_entropy_circuit(),
+            self.quantum_backend
+        )
         
         # Create initial entropy
         asyncio.create_task(self._maintain_entropy_pool())
@@ -158,35 +165,37 @@ class QuantumSystem:
     async def _generate_quantum_entropy(self) -> None:
         """Generate and add entropy to pool"""
         try:
-            # Create quantum circuit for entropy generation
-            num_qubits = self.qubits_per_byte * 8  # Generate 8 bytes at a time
-            qr = QuantumRegister(num_qubits)
-            cr = ClassicalRegister(num_qubits)
-            circuit = QuantumCircuit(qr, cr)
-            
-            # Apply quantum gates
-            for i in range(num_qubits):
-                circuit.h(qr[i])  # Hadamard gates for superposition
-                
-            # Add measurement
-            circuit.measure(qr, cr)
-            
-            # Execute circuit
-            job = execute(circuit, self.quantum_backend, shots=1)
+            # Execute the cached circuit, batching several shots into one job
+            job = self.quantum_backend.run(
+                self.entropy_circuit,
+                shots=self.entropy_shots,
+                memory=True
+            )
             result = job.result()
             
-            # Convert to bytes
-            measurements = result.get_counts(circuit)
-            bits = next(iter(measurements.keys()))
-            entropy_bytes = int(bits, 2).to_bytes(8, byteorder='big')
-            
-            # Add to pool
-            self.entropy_pool.extend(entropy_bytes)
+            # Convert each shot's measurement to bytes and add to pool
+            for bits in result.get_memory(self.entropy_circuit):
+                self.entropy_pool.extend(int(bits, 2).to_bytes(8, byteorder='big'))
 
         except Exception as e:
             logger.error(f"Quantum entropy generation failed: {str(e)}")
             raise
 
+    def _create_entropy_circuit(self) -> QuantumCircuit:
+        """Create quantum circuit for entropy generation"""
+        num_qubits = self.qubits_per_byte * 8  # Generate 8 bytes at a time
+        qr = QuantumRegister(num_qubits)
+        cr = ClassicalRegister(num_qubits)
+        circuit = QuantumCircuit(qr, cr)
+        
+        # Apply quantum gates
+        for i in range(num_qubits):
+            circuit.h(qr[i])  # Hadamard gates for superposition
+            
+        # Add measurement
+        circuit.measure(qr, cr)
+        return circuit
+
     async def _maintain_entropy_pool(self) -> None:
         """Maintain minimum entropy pool size"""
         try:
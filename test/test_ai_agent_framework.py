@@ -0,0 +1,39 @@
+"""
+Tests for AIAgent zero-knowledge proof generation
+"""
+import os
+import sys
+from hashlib import sha256
+
+import pytest
+
+py_ecc_bn128 = pytest.importorskip("py_ecc.bn128")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.ai_agent_framework import AIAgent
+
+def _reference_proof(data_hash):
+    """Affine py_ecc multiplication, serialized as big-endian x || y"""
+    scalar = int.from_bytes(data_hash, 'big') % py_ecc_bn128.curve_order
+    x, y = py_ecc_bn128.multiply(py_ecc_bn128.G1, scalar)
+    return x.n.to_bytes(32, 'big') + y.n.to_bytes(32, 'big')
+
+class TestZkProofs:
+    """Proofs are 64-byte BN254 point serializations, however they are produced"""
+
+    def test_proof_matches_reference(self):
+        agent = AIAgent("prover", "security")
+        proof = agent.generate_zk_proof("network state")
+
+        assert isinstance(proof, bytes)
+        assert proof == _reference_proof(sha256(b"network state").digest())
+
+    def test_batch_and_file_proofs_agree(self, tmp_path):
+        agent = AIAgent("prover", "security")
+        data_file = tmp_path / "state.bin"
+        data_file.write_bytes(b"prefix-payload")
+
+        batch = agent.generate_zk_proofs([b"payload"], prefix=b"prefix-")
+        assert batch == [agent.generate_zk_proof(b"prefix-payload")]
+        assert agent.generate_zk_proof_from_file(data_file) == batch[0]
@@ -0,0 +1,63 @@
+"""
+Tests for the closed-form cross-validated NetworkOptimizationModel
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import GridSearchCV
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai.optimization import NetworkOptimizationModel
+
+@pytest.fixture
+def dataset():
+    """Fixed regression problem with a non-zero intercept and some noise"""
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(200, 4))
+    y = X @ np.array([1.5, -2.0, 0.5, 3.0]) + 4.0 + rng.normal(scale=0.3, size=200)
+    return X, y
+
+def _grid_search(X, y):
+    """The GridSearchCV setup NetworkOptimizationModel replaces"""
+    return GridSearchCV(
+        LinearRegression(),
+        param_grid=NetworkOptimizationModel.param_grid,
+        cv=5
+    ).fit(X, y)
+
+class TestNetworkOptimizationModel:
+    """Closed-form CV must agree with GridSearchCV on the same folds"""
+
+    def test_matches_grid_search(self, dataset):
+        X, y = dataset
+        model = NetworkOptimizationModel(X, y)
+        reference = _grid_search(X, y)
+
+        assert model.best_params_ == reference.best_params_
+        assert model.best_index_ == reference.best_index_
+        assert model.best_score_ == pytest.approx(reference.best_score_)
+        for key in ('mean_test_score', 'std_test_score', *(f'split{i}_test_score' for i in range(5))):
+            np.testing.assert_allclose(model.cv_results_[key], reference.cv_results_[key])
+        np.testing.assert_array_equal(model.cv_results_['rank_test_score'],
+                                      reference.cv_results_['rank_test_score'])
+
+    def test_predictions_match_best_estimator(self, dataset):
+        X, y = dataset
+        model = NetworkOptimizationModel(X, y)
+        reference = _grid_search(X, y)
+
+        np.testing.assert_allclose(model.predict(X), reference.predict(X))
+        assert model.score(X, y) == pytest.approx(reference.score(X, y))
+
+    def test_evaluate_model_uses_current_data(self, dataset):
+        X, y = dataset
+        model = NetworkOptimizationModel(X, y)
+        model.fit(X[:100], y[:100])
+
+        # evaluate_model scores self.data, whatever was fitted last
+        expected = _grid_search(X, y).cv_results_['mean_test_score'][model.best_index_]
+        assert model.evaluate_model()["mean_score"] == pytest.approx(expected)